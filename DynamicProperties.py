@@ -1,3 +1,9 @@
+import os
+import stat
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import bpy
 
@@ -7,6 +13,7 @@ from bpy.props import (
     FloatProperty,
     FloatVectorProperty,
     IntProperty,
+    IntVectorProperty,
     PointerProperty,
     StringProperty,
 )
@@ -16,9 +23,29 @@ from bpy.types import (
     Panel
 )
 
+from mathutils import Matrix
+
+# NumPy ships with Blender, but fall back to array.array buffers without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Base type for `bpy.type.*` classes that can be registered
 StructMetaProp = bpy.types.bpy_struct_meta_idprop
 
+# Property types backed by a FloatVectorProperty
+FLOAT_ARRAY_TYPES = {'vec2', 'vec3', 'rgb', 'rgba', 'mat3', 'mat4', 'float_array'}
+
+# Property types backed by an IntVectorProperty
+INT_ARRAY_TYPES = {'ivec2', 'ivec3', 'ivec4', 'int_array'}
+
+# Largest size this module accepts for add_float_array/add_int_array
+MAX_ARRAY_SIZE = 32
+
+# Property types that reference a file or directory on disk
+PATH_TYPES = {'file', 'dir', 'image'}
+
 
 def get_key(bpy_type: StructMetaProp, name: str) -> str:
     """Internal method to create a unique key for a dynamic property group
@@ -30,6 +57,129 @@ def get_key(bpy_type: StructMetaProp, name: str) -> str:
     return '{}{}'.format(bpy_type.__name__, name)
 
 
+def new_buffer(prop_type: str, size: int):
+    """Internal method to allocate a flat buffer for an array property
+
+    Args:
+        prop_type (str):    One of FLOAT_ARRAY_TYPES or INT_ARRAY_TYPES
+        size (int):         Number of elements in the buffer
+
+    Returns:
+        numpy.ndarray if NumPy is available, otherwise array.array.
+        Floats are 32 bit and ints are 32 bit signed to match the
+        storage Blender uses for vector properties.
+    """
+    if prop_type in FLOAT_ARRAY_TYPES:
+        dtype, typecode = 'float32', 'f'
+    elif prop_type in INT_ARRAY_TYPES:
+        dtype, typecode = 'int32', 'i'
+    else:
+        raise TypeError('Property type {} is not an array type'.format(prop_type))
+
+    if np is not None:
+        return np.empty(size, dtype=dtype)
+
+    return array(typecode, bytes(size * array(typecode).itemsize))
+
+
+def new_buffer_from(prop_type: str, values):
+    """Internal method to copy values into a flat buffer for an array property
+
+    Args:
+        prop_type (str):    One of FLOAT_ARRAY_TYPES or INT_ARRAY_TYPES
+        values:             Flat sequence or buffer of values to copy,
+                            or a mathutils.Matrix to flatten column-major
+
+    Returns:
+        Buffer of the same type and element format as `new_buffer()`
+
+    Raises:
+        ValueError: If values is nested rather than flat
+    """
+    buffer = new_buffer(prop_type, 0)
+
+    # Iterating a Matrix yields rows, so walk the columns to
+    # match the flat column-major storage of matrix properties
+    if isinstance(values, Matrix):
+        values = [v for col in values.col for v in col]
+
+    if np is not None:
+        buffer = np.ascontiguousarray(values, dtype=buffer.dtype)
+        if buffer.ndim != 1:
+            raise ValueError('Expected a flat sequence of values, got shape {}'.format(buffer.shape))
+        return buffer
+
+    try:
+        return array(buffer.typecode, values)
+    except TypeError:
+        raise ValueError('Expected a flat sequence of values')
+
+
+class PathStatCache:
+    """Thread safe cache of os.stat() results for asset paths
+
+    Each path is stat'ed at most once per `ttl` seconds. The cache only
+    shares raw stat results - deciding whether a path changed is left to
+    each caller, which compares against its own last known signatures.
+
+    Attributes:
+        ttl (float):    Seconds a cached stat is trusted before it is refreshed
+    """
+    def __init__(self, ttl: float = 5.0):
+        """
+        Args:
+            ttl (float):    Seconds a cached stat is trusted before it is refreshed
+        """
+        self.ttl = ttl
+        self.entries = dict() # path -> (checked_at, signature)
+        self.lock = threading.Lock()
+
+    def stat(self, path: str) -> Optional[tuple]:
+        """Stat a path, reusing the cached result if it has not expired
+
+        Safe to call from worker threads.
+
+        Args:
+            path (str): Absolute path to check
+
+        Returns:
+            Optional[tuple]:    (mtime_ns, size, is_dir) or None if the path does not exist
+        """
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(path)
+
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+
+        try:
+            result = os.stat(path)
+            signature = (result.st_mtime_ns, result.st_size, stat.S_ISDIR(result.st_mode))
+        except OSError:
+            signature = None
+
+        with self.lock:
+            self.entries[path] = (now, signature)
+
+        return signature
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop cached results so the next stat() hits the disk
+
+        Args:
+            path (Optional[str]):   Path to drop, or None to drop all paths
+        """
+        with self.lock:
+            if path is None:
+                self.entries.clear()
+            elif path in self.entries:
+                del self.entries[path]
+
+
+# Default cache shared by all DynamicProperties.check_paths() calls
+path_stat_cache = PathStatCache()
+
+
 class BaseDynamicPanel(Panel):
     """Base class for panels associated with dynamic property groups
 
@@ -97,6 +247,17 @@ class BaseDynamicPanel(Panel):
                     open='image.open',
                     text=meta[1]
                 )
+            elif meta[0] in ('mat3', 'mat4'):
+                # Flat matrix storage is column-major, so draw it as
+                # a grid of rows by striding through the columns
+                size = 3 if meta[0] == 'mat3' else 4
+                col.separator()
+                col.label(text=meta[1])
+                grid = col.column(align=True)
+                for r in range(size):
+                    row = grid.row(align=True)
+                    for c in range(size):
+                        row.prop(props, key, index=c * size + r, text='')
             else:
                 # Standard property editor
                 col.prop(props, key)
@@ -112,9 +273,14 @@ class BaseDynamicPropertyGroup(PropertyGroup):
         meta (dict):                Mapping of property keys to a tuple of (prop_type, name, description)
     """
 
-    def items(self) -> dict:
+    def items(self, flat: bool = False) -> dict:
         """Return a dictionary of current property metadata and values
 
+        Args:
+            flat (bool):    Return values of array types (`vec3`, `mat4`, `ivec2`, etc)
+                            as flat buffers from `get_buffer()` instead of
+                            Blender's property arrays
+
         Returns:
             dict:   Mapping property key to a tuple of (type, value)
                     where type is one of `float`, `vec3`, `image`, etc
@@ -122,11 +288,77 @@ class BaseDynamicPropertyGroup(PropertyGroup):
         """
         items = dict()
         for key, meta in self.meta.items(): # meta being ('vec3', name, description)
-            if key != 'enabled' and meta[0] != 'header': # skip the internal `enabled` flag prop
+            if key == 'enabled' or meta[0] == 'header': # skip the internal `enabled` flag prop
+                continue
+
+            if flat and (meta[0] in FLOAT_ARRAY_TYPES or meta[0] in INT_ARRAY_TYPES):
+                items[key] = (meta[0], self.get_buffer(key))
+            else:
                 items[key] = (meta[0], getattr(self, key))
 
         return items
 
+    def get_buffer(self, key: str):
+        """Read an array property into a flat buffer
+
+        Matrices are flattened in column-major order, matching
+        what glUniformMatrix* expects without a transpose.
+
+        Args:
+            key (str):  Key of a vector, color, matrix, or array property
+
+        Returns:
+            numpy.ndarray (float32 or int32) if NumPy is available,
+            otherwise an array.array of the same element type.
+        """
+        prop_type = self.meta[key][0]
+        value = getattr(self, key)
+
+        # Plain vectors come back as a bpy_prop_array that
+        # foreach_get can copy straight into the buffer
+        if hasattr(value, 'foreach_get'):
+            buffer = new_buffer(prop_type, len(value))
+            value.foreach_get(buffer)
+            return buffer
+
+        # COLOR and MATRIX subtypes come back wrapped as mathutils types
+        # instead, which new_buffer_from flattens in storage order
+        if isinstance(value, Matrix):
+            return new_buffer_from(prop_type, value)
+
+        return new_buffer_from(prop_type, value[:])
+
+    def set_buffer(self, key: str, values):
+        """Write a flat buffer into an array property
+
+        Args:
+            key (str):  Key of a vector, color, matrix, or array property
+            values:     Flat sequence or buffer with one element per
+                        component of the property, or a mathutils.Matrix.
+                        Flat matrix values are expected in column-major order.
+
+        Raises:
+            ValueError: If values is nested or has the wrong number of elements
+        """
+        # Take the length from the definition, since len() of a
+        # mathutils wrapper (e.g. a Matrix) counts rows, not elements
+        size = self.bl_rna.properties[key].array_length
+
+        # Match the buffer format so foreach_set can copy it directly
+        values = new_buffer_from(self.meta[key][0], values)
+
+        if len(values) != size:
+            raise ValueError('Expected {} values for `{}`, got {}'.format(
+                size, key, len(values)
+            ))
+
+        value = getattr(self, key)
+        if hasattr(value, 'foreach_set'):
+            value.foreach_set(values)
+        else:
+            # Assigning a flat sequence writes the raw column-major storage
+            setattr(self, key, values.tolist())
+
     @classmethod
     def register(cls):
         setattr(cls.bpy_type, cls.name, PointerProperty(
@@ -299,6 +531,168 @@ class PropertyCollection:
         self.props[key] = FloatVectorProperty(**args)
         self.meta[key] = ('rgba', name, kwargs.get('description', ''))
 
+    def add_ivec2(self, key: str, name: str, **kwargs):
+        """Add a 2 dimensional vector of ints.
+
+        Args:
+            key (str):  Unique key
+            name (str): Name used in the user interface
+
+        Keyword Args:
+            Accepts bpy.props.IntVectorProperty kwargs
+        """
+        args = {
+            'size': 2,
+            'name': name,
+        }
+
+        args = {**kwargs, **args}
+        self.props[key] = IntVectorProperty(**args)
+        self.meta[key] = ('ivec2', name, kwargs.get('description', ''))
+
+    def add_ivec3(self, key: str, name: str, **kwargs):
+        """Add a 3 dimensional vector of ints.
+
+        Args:
+            key (str):  Unique key
+            name (str): Name used in the user interface
+
+        Keyword Args:
+            Accepts bpy.props.IntVectorProperty kwargs
+        """
+        args = {
+            'size': 3,
+            'name': name,
+        }
+
+        args = {**kwargs, **args}
+        self.props[key] = IntVectorProperty(**args)
+        self.meta[key] = ('ivec3', name, kwargs.get('description', ''))
+
+    def add_ivec4(self, key: str, name: str, **kwargs):
+        """Add a 4 dimensional vector of ints.
+
+        Args:
+            key (str):  Unique key
+            name (str): Name used in the user interface
+
+        Keyword Args:
+            Accepts bpy.props.IntVectorProperty kwargs
+        """
+        args = {
+            'size': 4,
+            'name': name,
+        }
+
+        args = {**kwargs, **args}
+        self.props[key] = IntVectorProperty(**args)
+        self.meta[key] = ('ivec4', name, kwargs.get('description', ''))
+
+    def add_mat3(self, key: str, name: str, **kwargs):
+        """Add a 3x3 matrix of floats.
+
+        Stored as a flat, column-major vector of 9 floats.
+        Defaults to the identity matrix.
+
+        Args:
+            key (str):  Unique key
+            name (str): Name used in the user interface
+
+        Keyword Args:
+            Accepts bpy.props.FloatVectorProperty kwargs
+        """
+        args = {
+            'size': 9,
+            'name': name,
+            'subtype': 'MATRIX',
+        }
+
+        args = {
+            'default': (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0),
+            **kwargs,
+            **args
+        }
+        self.props[key] = FloatVectorProperty(**args)
+        self.meta[key] = ('mat3', name, kwargs.get('description', ''))
+
+    def add_mat4(self, key: str, name: str, **kwargs):
+        """Add a 4x4 matrix of floats.
+
+        Stored as a flat, column-major vector of 16 floats.
+        Defaults to the identity matrix.
+
+        Args:
+            key (str):  Unique key
+            name (str): Name used in the user interface
+
+        Keyword Args:
+            Accepts bpy.props.FloatVectorProperty kwargs
+        """
+        args = {
+            'size': 16,
+            'name': name,
+            'subtype': 'MATRIX',
+        }
+
+        args = {
+            'default': (
+                1.0, 0.0, 0.0, 0.0,
+                0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0,
+                0.0, 0.0, 0.0, 1.0
+            ),
+            **kwargs,
+            **args
+        }
+        self.props[key] = FloatVectorProperty(**args)
+        self.meta[key] = ('mat4', name, kwargs.get('description', ''))
+
+    def add_float_array(self, key: str, name: str, size: int, **kwargs):
+        """Add a fixed size array of floats.
+
+        Args:
+            key (str):  Unique key
+            name (str): Name used in the user interface
+            size (int): Number of elements, up to MAX_ARRAY_SIZE
+
+        Keyword Args:
+            Accepts bpy.props.FloatVectorProperty kwargs
+        """
+        if size < 1 or size > MAX_ARRAY_SIZE:
+            raise ValueError('Array size must be between 1 and {}'.format(MAX_ARRAY_SIZE))
+
+        args = {
+            'size': size,
+            'name': name,
+        }
+
+        args = {**kwargs, **args}
+        self.props[key] = FloatVectorProperty(**args)
+        self.meta[key] = ('float_array', name, kwargs.get('description', ''))
+
+    def add_int_array(self, key: str, name: str, size: int, **kwargs):
+        """Add a fixed size array of ints.
+
+        Args:
+            key (str):  Unique key
+            name (str): Name used in the user interface
+            size (int): Number of elements, up to MAX_ARRAY_SIZE
+
+        Keyword Args:
+            Accepts bpy.props.IntVectorProperty kwargs
+        """
+        if size < 1 or size > MAX_ARRAY_SIZE:
+            raise ValueError('Array size must be between 1 and {}'.format(MAX_ARRAY_SIZE))
+
+        args = {
+            'size': size,
+            'name': name,
+        }
+
+        args = {**kwargs, **args}
+        self.props[key] = IntVectorProperty(**args)
+        self.meta[key] = ('int_array', name, kwargs.get('description', ''))
+
     def add_enum(self, key: str, name: str, **kwargs):
         """Add a dropdown enum of options
 
@@ -408,6 +802,8 @@ class DynamicProperties(PropertyCollection):
         title (str):                    Title used for the associated panel
         registered_properties (dict):   Mapping a DynamicProperties name to an instance.
                                         This tracks all instances registered with Blender
+        path_signatures (dict):         Mapping an absolute path to the signature seen
+                                        by the last check_paths() call of this group
     """
     registered_properties = dict()
 
@@ -433,6 +829,7 @@ class DynamicProperties(PropertyCollection):
         self.name = name
         self.title = title
         self.panel_parent_id = panel_parent_id
+        self.path_signatures = dict()
 
     def register(self, base_property_group = BaseDynamicPropertyGroup, base_panel = BaseDynamicPanel):
         """Register this property group and panel with Blender
@@ -523,6 +920,164 @@ class DynamicProperties(PropertyCollection):
         self.property_class = None
         self.panel_class = None
 
+    def check_paths(self, collection, cache: Optional[PathStatCache] = None,
+                    baseline: Optional[dict] = None, max_workers: Optional[int] = None,
+                    load_images: bool = False) -> dict:
+        """Check every `file`, `dir`, and `image` value of this group across a collection
+
+        Paths are resolved on the calling thread, deduplicated, and then
+        stat'ed concurrently in a thread pool through a TTL'd cache.
+        A path is only reported as changed once it has been seen by a
+        previous check against the same baseline and its modification
+        time or size has since changed.
+
+        Args:
+            collection:                         bpy.data collection of instances
+                                                of `bpy_type` (e.g. bpy.data.materials)
+
+            cache (Optional[PathStatCache]):    Stat cache to use. Defaults
+                                                to the shared `path_stat_cache`
+
+            baseline (Optional[dict]):          Mapping of path to last known signature
+                                                to detect changes against, updated in
+                                                place. Defaults to `path_signatures`
+                                                so each group sees every change once.
+                                                The default baseline is pruned down to
+                                                the paths that exist in this check
+
+            max_workers (Optional[int]):        Thread pool size passed through
+                                                to ThreadPoolExecutor
+
+            load_images (bool):                 Load existing `file` values with an
+                                                image extension into bpy.data.images,
+                                                and reload changed `image` values and
+                                                already loaded images of changed `file`
+                                                values so they match what is on disk
+
+        Returns:
+            dict:   `missing`, `changed`, and `failed` map to lists of
+                    (id_data, key, path) tuples, where `failed` holds image
+                    files that exist but could not be loaded.
+                    `images` is a list of the bpy.types.Image instances that were
+                    loaded or reloaded when `load_images` is set.
+        """
+        if cache is None:
+            cache = path_stat_cache
+
+        prune = baseline is None
+        if prune:
+            baseline = self.path_signatures
+
+        keys = [(key, meta[0]) for key, meta in self.meta.items() if meta[0] in PATH_TYPES]
+
+        # Resolve everything on this thread - bpy is not safe to touch from workers
+        entries = [] # (id_data, key, prop_type, path, image)
+        for id_data in collection:
+            props = getattr(id_data, self.name, None)
+            if props is None:
+                continue
+
+            for key, prop_type in keys:
+                value = getattr(props, key)
+                image = None
+
+                if prop_type == 'image':
+                    # Packed and generated images have nothing on disk to check
+                    if value is None or value.packed_file or value.source not in {'FILE', 'SEQUENCE', 'MOVIE'}:
+                        continue
+                    image = value
+                    path = bpy.path.abspath(image.filepath, library=image.library)
+                elif value:
+                    path = bpy.path.abspath(value, library=id_data.library)
+                else:
+                    continue
+
+                entries.append((id_data, key, prop_type, os.path.normpath(path), image))
+
+        paths = list({entry[3] for entry in entries})
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            signatures = dict(zip(paths, executor.map(cache.stat, paths)))
+
+        changed_paths = set()
+        for path, signature in signatures.items():
+            previous = baseline.get(path)
+            if signature is None:
+                # Nothing to compare against once a missing path comes back
+                baseline.pop(path, None)
+                continue
+
+            if previous is not None and previous != signature:
+                changed_paths.add(path)
+            baseline[path] = signature
+
+        # Forget paths that are no longer referenced by this group
+        if prune:
+            for path in set(baseline) - set(signatures):
+                del baseline[path]
+
+        report = {
+            'missing': [],
+            'changed': [],
+            'failed': [],
+            'images': [],
+        }
+
+        # Pointers of images already in the report
+        seen_images = set()
+
+        # Path of each image file to the Image loaded from it,
+        # or None if it failed, so each file is only loaded once
+        loaded_files = dict()
+        image_extensions = tuple(bpy.path.extensions_image)
+
+        for id_data, key, prop_type, path, image in entries:
+            signature = signatures[path]
+            changed = path in changed_paths
+
+            if signature is None or signature[2] != (prop_type == 'dir'):
+                report['missing'].append((id_data, key, path))
+                continue
+
+            # Directory mtimes change whenever their contents do, so skip them
+            if changed and prop_type != 'dir':
+                report['changed'].append((id_data, key, path))
+
+            if not load_images:
+                continue
+
+            if image is not None:
+                if changed and image.as_pointer() not in seen_images:
+                    image.reload()
+                    seen_images.add(image.as_pointer())
+                    report['images'].append(image)
+            elif prop_type == 'file' and path.lower().endswith(image_extensions):
+                if path in loaded_files:
+                    if loaded_files[path] is None:
+                        report['failed'].append((id_data, key, path))
+                    continue
+
+                # Corrupt or unsupported files shouldn't abort the whole report
+                count = len(bpy.data.images)
+                try:
+                    loaded = bpy.data.images.load(path, check_existing=True)
+                except RuntimeError:
+                    loaded_files[path] = None
+                    report['failed'].append((id_data, key, path))
+                    continue
+
+                loaded_files[path] = loaded
+
+                # check_existing hands back an already loaded datablock
+                # without reading the file again, so pick up changes here
+                if changed and len(bpy.data.images) == count:
+                    loaded.reload()
+
+                if loaded.as_pointer() not in seen_images:
+                    seen_images.add(loaded.as_pointer())
+                    report['images'].append(loaded)
+
+        return report
+
     @classmethod
     def find(cls, bpy_type: StructMetaProp, name: str) -> Optional['DynamicProperties']:
         """Find a registered DynamicProperties instance.
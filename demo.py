@@ -97,6 +97,9 @@ fizz.add_vec2('my_v2', name='Vec2 Test', description='Test Vec2')
 fizz.add_vec3('my_v3', name='Vec3 Test', description='Test Vec3')
 fizz.add_rgb('diffuse', name='Diffuse', description='Diffuse color')
 fizz.add_rgba('rgba', name='RGBA Color')
+fizz.add_ivec3('my_iv3', name='IVec3 Test', description='Test IVec3')
+fizz.add_mat4('my_mat4', name='Mat4 Test', description='Test Mat4')
+fizz.add_float_array('my_weights', name='Weights', size=6, description='Test float array')
 
 fizz.add_enum('my_enum', name='My Enum', description='Some Enum',
     items=[('foo', 'Foo', 'Foo Description'), ('bar', 'Bar', 'Bar Description')]